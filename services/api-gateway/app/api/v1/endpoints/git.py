@@ -1,33 +1,75 @@
 """Git operations endpoints."""
 
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Any, Literal, Optional, List
+import msgspec
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
-from app.services.git_service import GitService
+from app.services.git_service import GitService, MAX_TREE_DEPTH
 from app.api.v1.auth import get_current_user
 from app.models.user import User
 
 router = APIRouter()
 
+_msgspec_encoder = msgspec.json.Encoder()
 
-@router.get("/workspaces")
+
+class MsgspecJSONResponse(Response):
+    """JSON response that encodes msgspec Structs directly from their fields."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _msgspec_encoder.encode(content)
+
+
+@router.get("/workspaces", response_class=ORJSONResponse)
 async def list_workspaces(
+    layout: Literal["records", "columns"] = "records",
     current_user = Depends(get_current_user)
 ):
     """
     List all Git workspaces (repositories) for the current user.
     
+    Args:
+        layout: "records" (default) or "columns" for parallel arrays
+        
     Returns:
         List of workspace information
     """
-    result = GitService.list_workspaces()
-    return result
+    result = GitService.list_workspaces(layout=layout)
+    return ORJSONResponse(result)
+
+
+@router.get("/workspaces/{workspace_id}/status", response_class=ORJSONResponse)
+async def get_workspace_status(
+    workspace_id: str,
+    current_user = Depends(get_current_user)
+):
+    """
+    Get whether a single workspace has uncommitted changes.
+    
+    The workspace list leaves is_dirty null unless a cached status is still
+    valid; clients fetch it here when a workspace is opened or hovered.
+    
+    Args:
+        workspace_id: Workspace (session) identifier
+        
+    Returns:
+        Workspace id and is_dirty flag
+    """
+    result = GitService.get_workspace_dirty(workspace_id)
+    
+    if not result.get("success"):
+        raise HTTPException(status_code=404, detail=result.get("error", "Status check failed"))
+    
+    return ORJSONResponse(result)
 
 
 class CloneRequest(BaseModel):
     """Request model for cloning a repository."""
     repo_url: str = Field(..., description="Git repository URL")
     branch: Optional[str] = Field(None, description="Branch to checkout")
+    full_history: bool = Field(True, description="Clone all branches and history; false for a shallow, single-branch clone")
 
 
 class CommitRequest(BaseModel):
@@ -64,6 +106,11 @@ class FileReadRequest(BaseModel):
     file_path: str = Field(..., description="Relative path to file in repository")
 
 
+class FilesReadRequest(BaseModel):
+    """Request model for reading several files at once."""
+    file_paths: List[str] = Field(..., description="Relative paths to files in repository")
+
+
 class FileWriteRequest(BaseModel):
     """Request model for writing a file."""
     file_path: str = Field(..., description="Relative path to file in repository")
@@ -86,10 +133,11 @@ async def clone_repository(
     Returns:
         Repository info and status
     """
-    result = GitService.clone_repository(
+    result = await GitService.clone_repository(
         session_id=session_id,
         repo_url=request.repo_url,
-        branch=request.branch
+        branch=request.branch,
+        full_history=request.full_history
     )
     
     if not result.get("success"):
@@ -166,7 +214,7 @@ async def push_changes(
     Returns:
         Push status
     """
-    result = GitService.push_changes(
+    result = await GitService.push_changes(
         session_id=session_id,
         remote=request.remote,
         branch=request.branch
@@ -194,7 +242,7 @@ async def pull_changes(
     Returns:
         Pull status
     """
-    result = GitService.pull_changes(
+    result = await GitService.pull_changes(
         session_id=session_id,
         remote=request.remote,
         branch=request.branch
@@ -283,9 +331,11 @@ async def checkout_branch(
     return result
 
 
-@router.get("/tree/{session_id}")
+@router.get("/tree/{session_id}", response_class=ORJSONResponse)
 async def get_file_tree(
     session_id: str,
+    layout: Literal["nested", "columns"] = "nested",
+    max_depth: int = Query(MAX_TREE_DEPTH, ge=1, le=MAX_TREE_DEPTH),
     current_user = Depends(get_current_user)
 ):
     """
@@ -293,19 +343,21 @@ async def get_file_tree(
     
     Args:
         session_id: Unique session identifier
+        layout: "nested" (default) or "columns" for parallel arrays
+        max_depth: Number of directory levels to list
         
     Returns:
         File tree structure
     """
-    result = GitService.get_file_tree(session_id)
+    result = GitService.get_file_tree(session_id, layout=layout, max_depth=max_depth)
     
     if not result.get("success"):
         raise HTTPException(status_code=404, detail=result.get("error", "Failed to get file tree"))
     
-    return result
+    return ORJSONResponse(result)
 
 
-@router.post("/files/read/{session_id}")
+@router.post("/files/read/{session_id}", response_class=MsgspecJSONResponse)
 async def read_file(
     session_id: str,
     request: FileReadRequest,
@@ -321,15 +373,69 @@ async def read_file(
     Returns:
         File content
     """
-    result = GitService.read_file(
+    result = await GitService.read_file(
         session_id=session_id,
         file_path=request.file_path
     )
     
+    if not result.success:
+        raise HTTPException(status_code=404, detail=result.error or "Failed to read file")
+    
+    return MsgspecJSONResponse(result)
+
+
+@router.post("/files/read-batch/{session_id}", response_class=MsgspecJSONResponse)
+async def read_files(
+    session_id: str,
+    request: FilesReadRequest,
+    current_user = Depends(get_current_user)
+):
+    """
+    Read several files from the repository in one request.
+    
+    Args:
+        session_id: Unique session identifier
+        request: Batch read request with file paths
+        
+    Returns:
+        Per-file content or error, keyed by path
+    """
+    result = await GitService.read_files(
+        session_id=session_id,
+        file_paths=request.file_paths
+    )
+    
+    if not result.success:
+        raise HTTPException(status_code=400, detail=result.error or "Failed to read files")
+    
+    return MsgspecJSONResponse(result)
+
+
+@router.get("/files/raw/{session_id}")
+async def read_file_stream(
+    session_id: str,
+    file_path: str,
+    current_user = Depends(get_current_user)
+):
+    """
+    Stream a file's raw bytes from the repository.
+    
+    Unlike the JSON read endpoint, the file is sent straight from disk
+    without being decoded or embedded in a JSON body; use it for large files.
+    
+    Args:
+        session_id: Unique session identifier
+        file_path: Relative path to file in repository
+        
+    Returns:
+        Raw file content
+    """
+    result = GitService.locate_file(session_id, file_path)
+    
     if not result.get("success"):
         raise HTTPException(status_code=404, detail=result.get("error", "Failed to read file"))
     
-    return result
+    return FileResponse(result["full_path"], media_type="text/plain")
 
 
 @router.post("/files/write/{session_id}")
@@ -348,7 +454,7 @@ async def write_file(
     Returns:
         Write status
     """
-    result = GitService.write_file(
+    result = await GitService.write_file(
         session_id=session_id,
         file_path=request.file_path,
         content=request.content
@@ -658,6 +764,35 @@ async def get_diff(
     return result
 
 
+@router.post("/diff/stream/{session_id}")
+async def stream_diff(
+    session_id: str,
+    request: DiffRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream the diff between commits or working directory as plain text.
+    
+    Args:
+        session_id: Unique session identifier
+        request: Diff request
+        
+    Returns:
+        Streaming diff content
+    """
+    result = GitService.stream_diff(
+        session_id=session_id,
+        commit1=request.commit1,
+        commit2=request.commit2,
+        file_path=request.file_path
+    )
+    
+    if not result.get("success"):
+        raise HTTPException(status_code=404, detail=result.get("error", "Failed to get diff"))
+    
+    return StreamingResponse(result["stream"], media_type="text/plain")
+
+
 @router.post("/merge/{session_id}")
 async def merge_branch(
     session_id: str,
@@ -743,7 +878,7 @@ async def create_tag(
     return result
 
 
-@router.get("/tags/list/{session_id}")
+@router.get("/tags/list/{session_id}", response_class=MsgspecJSONResponse)
 async def list_tags(
     session_id: str,
     current_user: User = Depends(get_current_user)
@@ -759,7 +894,7 @@ async def list_tags(
     """
     result = GitService.list_tags(session_id)
     
-    if not result.get("success"):
-        raise HTTPException(status_code=404, detail=result.get("error", "Failed to list tags"))
+    if not result.success:
+        raise HTTPException(status_code=404, detail=result.error or "Failed to list tags")
     
-    return result
+    return MsgspecJSONResponse(result)
@@ -1,12 +1,29 @@
 """Git operations service for repository management."""
 
+import asyncio
+import copy
 import os
 import re
 import shutil
+import stat
+import subprocess
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import count, islice
 from typing import List, Dict, Optional
 from pathlib import Path
+import anyio
 import git
-from git import Repo, GitCommandError
+import msgspec
+from cachetools import TTLCache
+from git import Repo, GitCommandError, GitCmdObjectDB
+import pygit2
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,6 +37,144 @@ VALID_SESSION_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
 MAX_SESSION_ID_LENGTH = 128
 # Maximum file path length
 MAX_FILE_PATH_LENGTH = 1024
+# Maximum number of memoized file path validations
+PATH_CACHE_MAX_ENTRIES = 4096
+# Largest file read_file will load into memory
+MAX_READ_BYTES = 10 * 1024 * 1024
+# Maximum number of files read_files accepts in one batch
+MAX_BATCH_READ_FILES = 100
+# Leading bytes checked for NUL before a file is decoded as text
+BINARY_SNIFF_BYTES = 8 * 1024
+# Buffer size for larger file reads and writes
+FILE_IO_BUFFER_SIZE = 128 * 1024
+# Short-lived stat cache for file lookups, including misses
+STAT_CACHE_MAX_ENTRIES = 8192
+STAT_CACHE_TTL_SECONDS = 2.0
+
+# Response layouts supported by get_file_tree
+TREE_LAYOUTS = ("nested", "columns")
+# Deepest directory level get_file_tree lists
+MAX_TREE_DEPTH = 32
+# Response layouts supported by list_workspaces
+WORKSPACE_LAYOUTS = ("records", "columns")
+# Workspace fields, in column order for the "columns" layout
+WORKSPACE_FIELDS = (
+    "workspace_id", "name", "path", "branch", "remote_url", "is_dirty", "commit_count"
+)
+
+# Shared error responses returned as-is by every method; never mutate them
+_ERR_INVALID_SESSION = {"success": False, "error": "Invalid session ID"}
+_ERR_NO_REPO = {"success": False, "error": "No repository found for this session"}
+_ERR_INVALID_PATH = {"success": False, "error": "Invalid file path"}
+_ERR_OUT_OF_REPO = {"success": False, "error": "Access denied: file outside repository"}
+_ERR_NOT_FILE = {"success": False, "error": "Path is not a file"}
+_ERR_NOT_FOUND = {"success": False, "error": "File not found"}
+_ERR_TOO_LARGE = {"success": False, "error": f"File is larger than {MAX_READ_BYTES // (1024 * 1024)} MB"}
+_ERR_BATCH_TOO_LARGE = {"success": False, "error": f"Batch read exceeds {MAX_READ_BYTES // (1024 * 1024)} MB in total"}
+_ERR_DETACHED_HEAD = {"success": False, "error": "HEAD is detached; specify a branch"}
+
+# Fixed argv prefixes for the global Git identity. Descriptors opened by
+# Python are non-inheritable (PEP 446), so these short-lived git children
+# are spawned with close_fds=False to skip the close-every-fd pass.
+GIT_GLOBAL_NAME_CMD = ("git", "config", "--global", "user.name")
+GIT_GLOBAL_EMAIL_CMD = ("git", "config", "--global", "user.email")
+# Environment for direct git invocations, built once; never wait on a
+# credential prompt
+GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+# pygit2 status flags matching GitPython's index.diff(None) (worktree vs index);
+# unmerged paths carry only GIT_STATUS_CONFLICTED, so they are listed as modified
+STATUS_WORKTREE_CHANGED = (
+    pygit2.GIT_STATUS_WT_MODIFIED
+    | pygit2.GIT_STATUS_WT_DELETED
+    | pygit2.GIT_STATUS_WT_TYPECHANGE
+    | pygit2.GIT_STATUS_WT_RENAMED
+    | pygit2.GIT_STATUS_CONFLICTED
+)
+# pygit2 status flags matching GitPython's index.diff("HEAD") (index vs HEAD)
+STATUS_INDEX_CHANGED = (
+    pygit2.GIT_STATUS_INDEX_NEW
+    | pygit2.GIT_STATUS_INDEX_MODIFIED
+    | pygit2.GIT_STATUS_INDEX_DELETED
+    | pygit2.GIT_STATUS_INDEX_RENAMED
+    | pygit2.GIT_STATUS_INDEX_TYPECHANGE
+)
+
+# Commits fetched by a shallow (full_history=False) clone
+CLONE_DEFAULT_DEPTH = 1
+
+# session_id -> asyncio.Lock held around clone, push and pull
+_session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Shared pool for inspecting workspaces in list_workspaces
+WORKSPACE_SCAN_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+_workspace_executor = ThreadPoolExecutor(
+    max_workers=WORKSPACE_SCAN_MAX_WORKERS,
+    thread_name_prefix="workspace-scan"
+)
+
+# Maximum number of sessions whose validated repository path is memoized
+SESSION_REPO_MAX_ENTRIES = 1024
+
+# Maximum number of sessions whose resolved repository root is kept
+RESOLVED_ROOTS_MAX_ENTRIES = 1024
+# session_id -> repository root with symlinks resolved, least recently used first
+_RESOLVED_ROOTS: "OrderedDict[str, Path]" = OrderedDict()
+_resolved_roots_lock = threading.Lock()
+
+# Maximum number of open pygit2 Repository handles kept for reuse
+REPO_CACHE_MAX_ENTRIES = 256
+# session_id -> pygit2.Repository, least recently used first
+_PYGIT2_REPOS: "OrderedDict[str, pygit2.Repository]" = OrderedDict()
+_pygit2_repos_lock = threading.Lock()
+
+# Maximum number of formatted commit-log entries kept in memory; entries are
+# keyed by sha, so they never go stale
+COMMIT_CACHE_MAX_ENTRIES = 10_000
+
+# Maximum number of memoized (repository, HEAD sha) commit counts
+COMMIT_COUNT_CACHE_MAX_ENTRIES = 1024
+
+# Largest commit-log page preallocated up front
+COMMIT_LOG_PREALLOC_MAX = 1000
+
+# Maximum number of sessions whose get_status result is kept in memory
+STATUS_CACHE_MAX_ENTRIES = 256
+# Longest a cached get_status result is served, as a backstop for worktree
+# edits the status stamp cannot see
+STATUS_CACHE_TTL_SECONDS = 5.0
+# session_id -> (stat stamp, status result, generation), least recently used
+# first; an invalidated session keeps a (None, None, generation) entry so a
+# get_status that raced the write does not store its stale result
+_status_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_status_generations = count(1)
+_status_cache_lock = threading.Lock()
+# absolute path -> os.stat_result, or None for a path that does not exist
+_stat_cache = TTLCache(maxsize=STAT_CACHE_MAX_ENTRIES, ttl=STAT_CACHE_TTL_SECONDS)
+_stat_cache_lock = threading.Lock()
+
+
+class ReadFileResult(msgspec.Struct, omit_defaults=True):
+    """Result of GitService.read_file; unset fields are left out when encoded."""
+    success: bool
+    content: Optional[str] = None
+    path: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ReadFilesResult(msgspec.Struct, omit_defaults=True):
+    """Result of GitService.read_files, with one ReadFileResult per path."""
+    success: bool
+    files: Optional[Dict[str, ReadFileResult]] = None
+    error: Optional[str] = None
+
+
+class TagListResult(msgspec.Struct, omit_defaults=True):
+    """Result of GitService.list_tags; unset fields are left out when encoded."""
+    success: bool
+    tags: Optional[List[str]] = None
+    count: Optional[int] = None
+    error: Optional[str] = None
 
 
 def _validate_session_id(session_id: str) -> bool:
@@ -44,6 +199,7 @@ def _validate_session_id(session_id: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=PATH_CACHE_MAX_ENTRIES)
 def _validate_file_path(file_path: str) -> bool:
     """
     Validate file path to prevent path traversal attacks.
@@ -71,38 +227,612 @@ def _validate_file_path(file_path: str) -> bool:
     return True
 
 
-def _safe_resolve_path(base_path: Path, relative_path: str) -> Optional[Path]:
+def _resolved_root(session_id: str, repo_path: Path) -> Path:
+    """
+    Get the canonical path of a session's repository root.
+    
+    Resolved once per session and reused until _forget_resolved_root is
+    called for it (on re-clone), sparing the realpath walk per request.
+    Only roots of existing repositories are kept, least recently used
+    first out.
+    
+    Args:
+        session_id: The session identifier
+        repo_path: The repository root
+        
+    Returns:
+        The repository root with symlinks resolved
+    """
+    with _resolved_roots_lock:
+        repo_root = _RESOLVED_ROOTS.get(session_id)
+        if repo_root is not None:
+            _RESOLVED_ROOTS.move_to_end(session_id)
+            return repo_root
+    
+    repo_root = Path(os.path.realpath(repo_path))
+    # Unknown session ids must not take up cache slots
+    if _repo_exists(repo_path):
+        with _resolved_roots_lock:
+            _RESOLVED_ROOTS[session_id] = repo_root
+            _RESOLVED_ROOTS.move_to_end(session_id)
+            while len(_RESOLVED_ROOTS) > RESOLVED_ROOTS_MAX_ENTRIES:
+                _RESOLVED_ROOTS.popitem(last=False)
+    return repo_root
+
+
+def _forget_pygit2_repo(session_id: str) -> None:
+    """
+    Drop the cached pygit2 Repository for a session.
+    
+    Args:
+        session_id: The session identifier
+    """
+    with _pygit2_repos_lock:
+        _PYGIT2_REPOS.pop(session_id, None)
+
+
+def _forget_resolved_root(session_id: str) -> None:
     """
-    Safely resolve a path within a base directory, preventing path traversal.
+    Drop the cached resolved root for a session.
     
     Args:
-        base_path: The base directory path
+        session_id: The session identifier
+    """
+    with _resolved_roots_lock:
+        _RESOLVED_ROOTS.pop(session_id, None)
+
+
+def _safe_resolve_path(repo_root: Path, relative_path: str) -> Optional[Path]:
+    """
+    Safely resolve a path within a repository, preventing path traversal.
+    
+    Never memoized: any git operation, including one that fails midway,
+    can swap a directory for a symlink, so containment is checked against
+    the worktree as it is now.
+    
+    Args:
+        repo_root: The canonical repository root, from _resolved_root
         relative_path: The relative path to resolve
         
     Returns:
         Resolved Path if safe, None if path traversal detected
     """
     try:
-        # Resolve base path first
-        base_resolved = base_path.resolve()
-        # Join and resolve the full path
-        full_path = (base_path / relative_path).resolve()
-        # Check if the resolved path is within the base directory
-        if not str(full_path).startswith(str(base_resolved) + os.sep) and full_path != base_resolved:
+        # Join and resolve the full path against the canonical root
+        full_path = Path(os.path.realpath(os.path.join(repo_root, relative_path)))
+        # Component-wise containment, so /tmp/x_repo never passes for /tmp/x
+        if not full_path.is_relative_to(repo_root):
             return None
         return full_path
     except (ValueError, OSError):
         return None
 
 
+def _repo_exists(repo_path: Path) -> bool:
+    """
+    Check whether a directory holds a Git repository.
+    
+    A single os.path.isdir call on the .git directory; cheaper than
+    Path.exists(), which goes through Path.stat() and exception handling.
+    
+    Args:
+        repo_path: The repository root
+        
+    Returns:
+        True if repo_path/.git is a directory
+    """
+    return os.path.isdir(os.path.join(repo_path, ".git"))
+
+
+def _cached_stat(path: Path) -> Optional[os.stat_result]:
+    """
+    Stat a path through a short-TTL cache that also remembers misses.
+    
+    Repeated lookups of the same missing file (hover, autocomplete,
+    rapid clicks in the editor) are answered without touching the disk.
+    
+    Args:
+        path: Absolute, already-resolved path
+        
+    Returns:
+        os.stat_result, or None if the path does not exist
+    """
+    key = os.fspath(path)
+    with _stat_cache_lock:
+        try:
+            return _stat_cache[key]
+        except KeyError:
+            pass
+    try:
+        st = os.stat(key, follow_symlinks=False)
+    except (FileNotFoundError, NotADirectoryError):
+        st = None
+    with _stat_cache_lock:
+        _stat_cache[key] = st
+    return st
+
+
+def _invalidate_stat(path: Path) -> None:
+    """
+    Drop a single path from the stat cache.
+    
+    Args:
+        path: Absolute, already-resolved path
+    """
+    with _stat_cache_lock:
+        _stat_cache.pop(os.fspath(path), None)
+
+
+def _read_head_branch(repo_path: Path) -> Optional[str]:
+    """
+    Read the checked-out branch name straight from .git/HEAD.
+    
+    Args:
+        repo_path: The repository root
+        
+    Returns:
+        Branch name, or None if HEAD is detached
+    """
+    with open(repo_path / ".git" / "HEAD", "r", encoding="utf-8") as f:
+        head = f.read().strip()
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return None
+
+
+def _read_head_sha(repo_path: Path) -> Optional[str]:
+    """
+    Resolve HEAD to a commit sha by reading .git directly.
+    
+    Args:
+        repo_path: The repository root
+        
+    Returns:
+        Hex sha, or None for an unborn branch or unreadable HEAD
+    """
+    git_dir = repo_path / ".git"
+    try:
+        with open(git_dir / "HEAD", "r", encoding="utf-8") as f:
+            head = f.read().strip()
+    except FileNotFoundError:
+        return None
+    if not head.startswith("ref: "):
+        return head
+    
+    ref = head[len("ref: "):]
+    try:
+        with open(git_dir / ref, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        pass
+    try:
+        with open(git_dir / "packed-refs", "r", encoding="utf-8") as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _status_stamp(repo_path: Path) -> tuple:
+    """
+    Build a cheap change stamp for a repository's status.
+    
+    Combines the mtime and size of .git/index, the sha HEAD points at and
+    the worktree root's mtime; if none of them moved, the previous status
+    result is still valid. That assumes worktree changes go through
+    GitService, which invalidates the cache itself: an in-place edit to a
+    tracked file below the root made outside it moves none of them. The
+    stamp therefore also carries a STATUS_CACHE_TTL_SECONDS time bucket,
+    so such an edit is picked up within that interval.
+    
+    Args:
+        repo_path: The repository root
+        
+    Returns:
+        Tuple of stat fields (0 for a missing file), the HEAD sha and the
+        current time bucket
+    """
+    try:
+        index_stat = os.stat(repo_path / ".git" / "index")
+        index_stamp = (index_stat.st_mtime_ns, index_stat.st_size)
+    except FileNotFoundError:
+        index_stamp = (0, 0)
+    try:
+        worktree_mtime = os.stat(repo_path).st_mtime_ns
+    except FileNotFoundError:
+        worktree_mtime = 0
+    time_bucket = int(time.monotonic() // STATUS_CACHE_TTL_SECONDS)
+    return (*index_stamp, _read_head_sha(repo_path), worktree_mtime, time_bucket)
+
+
+def _invalidate_status_cache(session_id: str) -> None:
+    """
+    Drop the cached get_status result for a session.
+    
+    The entry is replaced by one carrying a new generation, so a get_status
+    computed before this call does not store its result afterwards.
+    
+    Args:
+        session_id: The session identifier
+    """
+    with _status_cache_lock:
+        _status_cache[session_id] = (None, None, next(_status_generations))
+        _status_cache.move_to_end(session_id)
+        while len(_status_cache) > STATUS_CACHE_MAX_ENTRIES:
+            _status_cache.popitem(last=False)
+
+
+def _read_global_git_user() -> tuple:
+    """
+    Read user.name and user.email from the global Git config.
+    
+    Returns:
+        Tuple of (name, email)
+        
+    Raises:
+        subprocess.CalledProcessError: If either value is not set
+    """
+    name = subprocess.run(
+        GIT_GLOBAL_NAME_CMD,
+        capture_output=True, text=True, check=True, close_fds=False
+    ).stdout.strip()
+    email = subprocess.run(
+        GIT_GLOBAL_EMAIL_CMD,
+        capture_output=True, text=True, check=True, close_fds=False
+    ).stdout.strip()
+    return name, email
+
+
+def _invalidate_worktree_caches(session_id: str) -> None:
+    """
+    Drop cached state after an operation rewrites a session's worktree.
+    
+    Checkouts, merges, resets, stashes and pulls can swap files for
+    symlinks, so cached stat results are discarded along with the
+    session's status entry. Call it from a finally block: a run that ends
+    in a conflict has still rewritten the worktree.
+    
+    Args:
+        session_id: The session identifier
+    """
+    _invalidate_status_cache(session_id)
+    with _stat_cache_lock:
+        _stat_cache.clear()
+
+
+def _git_raw(repo_path: Path, *args: str, input: Optional[str] = None) -> str:
+    """
+    Run a git command in a repository without going through GitPython.
+    
+    Args:
+        repo_path: The repository root
+        *args: git subcommand and arguments
+        input: Optional text fed to the command's stdin
+        
+    Returns:
+        Command stdout with the trailing newline removed
+        
+    Raises:
+        GitCommandError: If git exits with a non-zero status
+    """
+    argv = ("git", "-C", os.fspath(repo_path), *args)
+    proc = subprocess.run(
+        argv,
+        input=input,
+        capture_output=True,
+        encoding="utf-8",
+        errors="replace",
+        env=GIT_ENV,
+        close_fds=False
+    )
+    if proc.returncode != 0:
+        raise GitCommandError(argv, proc.returncode, proc.stderr, proc.stdout)
+    return proc.stdout.rstrip("\n")
+
+
+async def _git_async(repo_path: Optional[Path], *args: str) -> str:
+    """
+    Run a git command without blocking the event loop.
+    
+    Used for network-bound commands (clone, push, pull) so a worker can
+    serve other requests while they run.
+    
+    Args:
+        repo_path: The repository root, or None to run outside a repository
+        *args: git subcommand and arguments
+        
+    Returns:
+        Command stdout with the trailing newline removed
+        
+    Raises:
+        GitCommandError: If git exits with a non-zero status
+    """
+    location = ("-C", os.fspath(repo_path)) if repo_path is not None else ()
+    argv = ("git", *location, *args)
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=GIT_ENV
+    )
+    stdout, stderr = await proc.communicate()
+    stdout = stdout.decode("utf-8", errors="replace")
+    stderr = stderr.decode("utf-8", errors="replace")
+    if proc.returncode != 0:
+        raise GitCommandError(argv, proc.returncode, stderr, stdout)
+    return stdout.rstrip("\n")
+
+
+async def _remove_tree(path: Path) -> None:
+    """
+    Delete a directory tree without blocking the event loop.
+    
+    On POSIX a single `rm -rf` walks the tree in C, which is far faster than
+    shutil.rmtree for a .git directory full of small object files.
+    
+    Args:
+        path: Directory to remove
+        
+    Raises:
+        OSError: If the tree could not be removed
+    """
+    if os.name != "posix":
+        await anyio.to_thread.run_sync(shutil.rmtree, path)
+        return
+    proc = await asyncio.create_subprocess_exec(
+        "rm", "-rf", "--", os.fspath(path),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise OSError(f"Failed to remove {path}: {stderr.decode('utf-8', errors='replace').strip()}")
+
+
+def _session_lock(session_id: str) -> asyncio.Lock:
+    """
+    Get the lock serializing network git operations for a session.
+    
+    Locks live only while some request holds a reference to them.
+    
+    Args:
+        session_id: The session identifier
+        
+    Returns:
+        asyncio.Lock shared by concurrent requests for the session
+    """
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[session_id] = lock
+    return lock
+
+
+def _git_stream(repo_path: Path, *args: str):
+    """
+    Stream the stdout of a git command in FILE_IO_BUFFER_SIZE chunks.
+    
+    The process is only started once the generator is first advanced and
+    is reaped when the generator finishes or is closed early. stderr goes
+    to a temporary file so a chatty command cannot block on a full pipe.
+    
+    Args:
+        repo_path: The repository root
+        *args: git subcommand and arguments
+        
+    Yields:
+        Raw stdout chunks as bytes
+        
+    Raises:
+        GitCommandError: If git exits with a non-zero status; raised after
+            the output it did produce, so a streaming response is aborted
+            instead of ending as if it were complete
+    """
+    argv = ("git", "-C", os.fspath(repo_path), *args)
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            bufsize=FILE_IO_BUFFER_SIZE,
+            env=GIT_ENV,
+            close_fds=False
+        )
+        try:
+            while True:
+                chunk = proc.stdout.read1(FILE_IO_BUFFER_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+            returncode = proc.wait()
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+        
+        if returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode("utf-8", errors="replace")
+            logger.error(f"git {args[0]} failed while streaming: {message.strip()}")
+            raise GitCommandError(argv, returncode, message)
+
+
+@lru_cache(maxsize=COMMIT_COUNT_CACHE_MAX_ENTRIES)
+def _count_commits_at(repo_path: str, sha: str, shallow_mtime: int, limit: Optional[int]) -> int:
+    """
+    Count commits reachable from a sha with a single `git rev-list --count`.
+    
+    The history behind a sha never changes, so the count is memoized; the
+    shallow-file mtime is part of the key because deepening a shallow clone
+    adds history behind the same sha.
+    
+    Args:
+        repo_path: The repository root
+        sha: Commit to count from
+        shallow_mtime: mtime of .git/shallow in nanoseconds (0 if absent)
+        limit: Optional maximum number of commits to count
+        
+    Returns:
+        Number of commits
+    """
+    args = ["rev-list", "--count"]
+    if limit is not None:
+        args.append(f"--max-count={limit}")
+    return int(_git_raw(repo_path, *args, sha))
+
+
+def _count_commits(repo_path: Path, limit: Optional[int] = None) -> int:
+    """
+    Count commits reachable from HEAD, forking git only for a new HEAD.
+    
+    Args:
+        repo_path: The repository root
+        limit: Optional maximum number of commits to count
+        
+    Returns:
+        Number of commits (0 for an unborn HEAD)
+    """
+    head_sha = _read_head_sha(repo_path)
+    if head_sha is None:
+        # Unborn HEAD: nothing committed yet
+        return 0
+    try:
+        shallow_mtime = os.stat(repo_path / ".git" / "shallow").st_mtime_ns
+    except FileNotFoundError:
+        shallow_mtime = 0
+    try:
+        return _count_commits_at(os.fspath(repo_path), head_sha, shallow_mtime, limit)
+    except GitCommandError:
+        return 0
+
+
+def _list_local_branches(repo_path: Path) -> List[str]:
+    """
+    List local branch names from loose refs and .git/packed-refs.
+    
+    Reads the ref store directly instead of building a GitPython Head
+    object per branch, so the cost is one directory walk plus one file read.
+    
+    Args:
+        repo_path: The repository root
+        
+    Returns:
+        Sorted list of branch names
+    """
+    git_dir = repo_path / ".git"
+    branches = set()
+    
+    # Loose refs; branch names containing "/" live in subdirectories
+    heads_dir = str(git_dir / "refs" / "heads")
+    stack = [(heads_dir, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file():
+                        branches.add(prefix + entry.name)
+        except FileNotFoundError:
+            pass
+    
+    # Packed refs: "<sha> refs/heads/<name>" lines, skipping header and peeled lines
+    try:
+        with open(git_dir / "packed-refs", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("#", "^")):
+                    continue
+                _, _, ref = line.rstrip("\n").partition(" ")
+                if ref.startswith("refs/heads/"):
+                    branches.add(ref[len("refs/heads/"):])
+    except FileNotFoundError:
+        pass
+    
+    return sorted(branches)
+
+
+def _cached_is_dirty(workspace_dir: Path) -> Optional[bool]:
+    """
+    Report a workspace's dirty flag from the get_status cache.
+    
+    Computing it fresh walks the whole worktree, which is too expensive for
+    a summary of every workspace; callers needing a definite answer use
+    get_workspace_dirty or get_status.
+    
+    Args:
+        workspace_dir: Directory under REPOS_BASE_PATH
+        
+    Returns:
+        is_dirty from a still-valid cached status, or None if unknown
+    """
+    stamp = _status_stamp(workspace_dir)
+    with _status_cache_lock:
+        cached = _status_cache.get(workspace_dir.name)
+    if cached is None or cached[0] != stamp:
+        return None
+    return cached[1]["is_dirty"]
+
+
+def _describe_workspace(workspace_dir: Path) -> Optional[Dict[str, any]]:
+    """
+    Describe a single workspace directory for list_workspaces.
+    
+    Args:
+        workspace_dir: Directory under REPOS_BASE_PATH
+        
+    Returns:
+        Workspace dict, or None if the directory is not a readable repository
+    """
+    if not _repo_exists(workspace_dir):
+        return None
+    
+    try:
+        repo = pygit2.Repository(str(workspace_dir))
+        
+        # Get remote URL if available
+        remote_url = None
+        for remote in repo.remotes:
+            if remote.name == "origin":
+                remote_url = remote.url
+                break
+        
+        # Get repository name from path or remote URL
+        repo_name = workspace_dir.name
+        if remote_url:
+            # Extract repo name from URL (e.g., "octocat/Hello-World" from github URL)
+            repo_name = remote_url.rstrip('/').split('/')[-1].replace('.git', '')
+        
+        return {
+            "workspace_id": workspace_dir.name,
+            "name": repo_name,
+            "path": str(workspace_dir),
+            "branch": _read_head_branch(workspace_dir),
+            "remote_url": remote_url,
+            "is_dirty": _cached_is_dirty(workspace_dir),
+            "commit_count": _count_commits(workspace_dir, limit=100)
+        }
+    except Exception as e:
+        logger.warning(f"Error reading workspace {workspace_dir}: {e}")
+        return None
+
+
 class GitService:
     """Service for handling Git operations."""
 
     @staticmethod
+    @lru_cache(maxsize=SESSION_REPO_MAX_ENTRIES)
     def _get_repo_path(session_id: str) -> Optional[Path]:
         """
         Get the path for a session's repository with validation.
         
+        A pure function of session_id, so it is memoized; repeat calls skip
+        validation and Path construction.
+        
         Args:
             session_id: The session identifier
             
@@ -113,6 +843,84 @@ class GitService:
             return None
         return REPOS_BASE_PATH / session_id
 
+    @staticmethod
+    def _repo_for(session_id: str) -> Repo:
+        """
+        Open a GitPython Repo for a session's repository.
+        
+        Not memoized: each Repo keeps persistent `git cat-file` children
+        alive for as long as it exists, so handles are short-lived and their
+        processes exit when they are garbage-collected. Read-heavy paths use
+        the cached _pygit2_for instead. Callers must validate the session
+        and check that the repository exists first.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            Repo for the session's repository
+        """
+        return Repo(GitService._get_repo_path(session_id), odbt=GitCmdObjectDB)
+
+    @staticmethod
+    def _pygit2_for(session_id: str) -> pygit2.Repository:
+        """
+        Get a reusable pygit2 Repository for a session's repository.
+        
+        Memoized per session, least recently used first out, until
+        _forget_pygit2_repo is called for it (on re-clone); libgit2 handles
+        hold no child processes. Same contract as _repo_for: callers
+        validate the session and check the repository exists first.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            pygit2.Repository for the session's repository
+        """
+        with _pygit2_repos_lock:
+            repo = _PYGIT2_REPOS.get(session_id)
+            if repo is not None:
+                _PYGIT2_REPOS.move_to_end(session_id)
+                return repo
+        
+        repo = pygit2.Repository(os.fspath(GitService._get_repo_path(session_id)))
+        with _pygit2_repos_lock:
+            _PYGIT2_REPOS[session_id] = repo
+            _PYGIT2_REPOS.move_to_end(session_id)
+            while len(_PYGIT2_REPOS) > REPO_CACHE_MAX_ENTRIES:
+                _PYGIT2_REPOS.popitem(last=False)
+        return repo
+
+    @staticmethod
+    @lru_cache(maxsize=COMMIT_CACHE_MAX_ENTRIES)
+    def _commit_entry(session_id: str, sha: str) -> Dict[str, any]:
+        """
+        Build the commit-log entry for a single commit.
+        
+        A sha names immutable content, so the entry is memoized without any
+        invalidation; repeated log pages are served from the cache. Callers
+        must treat the returned dict as read-only.
+        
+        Args:
+            session_id: The session identifier
+            sha: Full hex id of the commit
+            
+        Returns:
+            Dict describing the commit
+        """
+        commit = GitService._pygit2_for(session_id)[sha]
+        committer_tz = timezone(timedelta(minutes=commit.commit_time_offset))
+        return {
+            "hash": sha,
+            "short_hash": sha[:7],
+            "author": commit.author.name,
+            "email": commit.author.email,
+            "message": commit.message.strip(),
+            "date": datetime.fromtimestamp(commit.commit_time, committer_tz).isoformat(),
+            "parent_count": len(commit.parent_ids)
+        }
+
     @staticmethod
     def configure_user(
         session_id: str,
@@ -135,27 +943,20 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not global_config and not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not global_config and not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
             if global_config:
                 # Configure globally
-                import subprocess
-                subprocess.run(["git", "config", "--global", "user.name", name], check=True)
-                subprocess.run(["git", "config", "--global", "user.email", email], check=True)
+                subprocess.run((*GIT_GLOBAL_NAME_CMD, name), check=True, close_fds=False)
+                subprocess.run((*GIT_GLOBAL_EMAIL_CMD, email), check=True, close_fds=False)
                 scope = "global"
             else:
                 # Configure for this repo only
-                repo = Repo(repo_path)
+                repo = GitService._repo_for(session_id)
                 with repo.config_writer() as git_config:
                     git_config.set_value("user", "name", name)
                     git_config.set_value("user", "email", email)
@@ -196,19 +997,13 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
+            repo = GitService._repo_for(session_id)
             
             # Update remote URL to include credentials
             if repo.remotes:
@@ -260,23 +1055,12 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
             # Always try global config first
-            import subprocess
             try:
-                name = subprocess.run(
-                    ["git", "config", "--global", "user.name"],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip()
-                email = subprocess.run(
-                    ["git", "config", "--global", "user.email"],
-                    capture_output=True, text=True, check=True
-                ).stdout.strip()
+                name, email = _read_global_git_user()
                 
                 if name and email:
                     return {
@@ -289,47 +1073,38 @@ class GitService:
                 pass
             
             # If no global config and no repo exists, return not configured
-            if not repo_path.exists():
+            if not _repo_exists(repo_path):
                 return {
                     "success": False,
                     "error": "Git user not configured",
                     "message": "No global Git config found. Please configure your Git user."
                 }
             
-            repo = Repo(repo_path)
-            with repo.config_reader() as git_config:
+            git_config = GitService._pygit2_for(session_id).config
+            try:
+                name = git_config["user.name"]
+                email = git_config["user.email"]
+                return {
+                    "success": True,
+                    "name": name,
+                    "email": email,
+                    "scope": "repository"
+                }
+            except KeyError:
+                # Fall back to global config
                 try:
-                    name = git_config.get_value("user", "name")
-                    email = git_config.get_value("user", "email")
+                    name, email = _read_global_git_user()
                     return {
                         "success": True,
                         "name": name,
                         "email": email,
-                        "scope": "repository"
+                        "scope": "global"
+                    }
+                except subprocess.CalledProcessError:
+                    return {
+                        "success": False,
+                        "error": "Git user not configured"
                     }
-                except Exception:
-                    # Fall back to global config
-                    import subprocess
-                    try:
-                        name = subprocess.run(
-                            ["git", "config", "--global", "user.name"],
-                            capture_output=True, text=True, check=True
-                        ).stdout.strip()
-                        email = subprocess.run(
-                            ["git", "config", "--global", "user.email"],
-                            capture_output=True, text=True, check=True
-                        ).stdout.strip()
-                        return {
-                            "success": True,
-                            "name": name,
-                            "email": email,
-                            "scope": "global"
-                        }
-                    except subprocess.CalledProcessError:
-                        return {
-                            "success": False,
-                            "error": "Git user not configured"
-                        }
         except Exception as e:
             logger.error(f"Error getting Git user config: {e}")
             return {
@@ -338,51 +1113,49 @@ class GitService:
             }
 
     @staticmethod
-    def list_workspaces() -> Dict[str, any]:
+    def list_workspaces(layout: str = "records") -> Dict[str, any]:
         """
         List all Git workspaces (cloned repositories).
         
+        The "records" layout returns one dict per workspace. The "columns"
+        layout returns one list per field (see WORKSPACE_FIELDS), indexed by
+        workspace, which avoids repeating every key for every workspace.
+        
+        Args:
+            layout: "records" (default) or "columns"
+            
         Returns:
             Dict with list of workspaces
         """
+        if layout not in WORKSPACE_LAYOUTS:
+            return {
+                "success": False,
+                "error": "Invalid workspace layout. Use 'records' or 'columns'"
+            }
+        
         try:
-            workspaces = []
-            
             if not REPOS_BASE_PATH.exists():
+                workspaces = []
+            else:
+                # Workspaces are independent and each inspection is dominated by
+                # git subprocess and stat latency, so inspect them concurrently
+                workspaces = [
+                    workspace
+                    for workspace in _workspace_executor.map(
+                        _describe_workspace, REPOS_BASE_PATH.iterdir()
+                    )
+                    if workspace is not None
+                ]
+            
+            if layout == "columns":
                 return {
                     "success": True,
-                    "workspaces": []
+                    "workspaces_soa": {
+                        field: [workspace[field] for workspace in workspaces]
+                        for field in WORKSPACE_FIELDS
+                    }
                 }
             
-            for workspace_dir in REPOS_BASE_PATH.iterdir():
-                if workspace_dir.is_dir() and (workspace_dir / ".git").exists():
-                    try:
-                        repo = Repo(workspace_dir)
-                        
-                        # Get remote URL if available
-                        remote_url = None
-                        if repo.remotes:
-                            remote_url = repo.remotes.origin.url
-                        
-                        # Get repository name from path or remote URL
-                        repo_name = workspace_dir.name
-                        if remote_url:
-                            # Extract repo name from URL (e.g., "octocat/Hello-World" from github URL)
-                            repo_name = remote_url.rstrip('/').split('/')[-1].replace('.git', '')
-                        
-                        workspaces.append({
-                            "workspace_id": workspace_dir.name,
-                            "name": repo_name,
-                            "path": str(workspace_dir),
-                            "branch": repo.active_branch.name,
-                            "remote_url": remote_url,
-                            "is_dirty": repo.is_dirty(),
-                            "commit_count": len(list(repo.iter_commits(max_count=100)))
-                        })
-                    except Exception as e:
-                        logger.warning(f"Error reading workspace {workspace_dir}: {e}")
-                        continue
-            
             return {
                 "success": True,
                 "workspaces": workspaces
@@ -395,18 +1168,28 @@ class GitService:
             }
 
     @staticmethod
-    def clone_repository(
+    async def clone_repository(
         session_id: str, 
         repo_url: str, 
-        branch: Optional[str] = None
+        branch: Optional[str] = None,
+        depth: Optional[int] = CLONE_DEFAULT_DEPTH,
+        full_history: bool = True
     ) -> Dict[str, any]:
         """
         Clone a Git repository for a session.
         
+        By default every branch and commit is cloned, with blobs fetched
+        lazily. Pass full_history=False for a shallow, single-branch clone;
+        the log and commit count then only cover the fetched commits, and
+        other remote branches cannot be checked out.
+        
         Args:
             session_id: Unique session identifier
             repo_url: Git repository URL
             branch: Optional branch name to checkout
+            depth: Number of commits to fetch for a shallow clone (None for all)
+            full_history: Clone all branches and history, ignoring depth
+                (default)
             
         Returns:
             Dict with status and repository info
@@ -414,25 +1197,42 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
+        
+        args = ["clone", "--filter=blob:none"]
+        if not full_history:
+            args.append("--single-branch")
+            if depth is not None:
+                args.append(f"--depth={depth}")
+        if branch:
+            args.extend(["--branch", branch])
+        args.extend(["--", repo_url, os.fspath(repo_path)])
         
         try:
-            # Remove existing repo if it exists
-            if repo_path.exists():
-                shutil.rmtree(repo_path)
-            
-            # Clone the repository
-            logger.info(f"Cloning {repo_url} to {repo_path}")
-            repo = Repo.clone_from(repo_url, repo_path, branch=branch)
+            async with _session_lock(session_id):
+                # Drop this session's handles to the old checkout before
+                # replacing it, and again afterwards in case a concurrent
+                # reader cached one while the clone was in flight
+                _forget_pygit2_repo(session_id)
+                _forget_resolved_root(session_id)
+                try:
+                    # Remove existing repo if it exists
+                    if repo_path.exists():
+                        await _remove_tree(repo_path)
+                    
+                    # Clone the repository
+                    logger.info(f"Cloning {repo_url} to {repo_path}")
+                    await _git_async(None, *args)
+                finally:
+                    _forget_pygit2_repo(session_id)
+                    _forget_resolved_root(session_id)
+                    _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
                 "message": "Repository cloned successfully",
                 "path": str(repo_path),
-                "branch": repo.active_branch.name,
+                "branch": _read_head_branch(repo_path),
                 "remote_url": repo_url
             }
         except GitCommandError as e:
@@ -464,36 +1264,102 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
+            return _ERR_INVALID_SESSION
+        
+        try:
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
+            
+            # Reuse the last result if nothing on disk moved since it was computed
+            stamp = _status_stamp(repo_path)
+            with _status_cache_lock:
+                cached = _status_cache.get(session_id)
+                if cached is not None and cached[0] == stamp:
+                    _status_cache.move_to_end(session_id)
+                    # Hand out a copy so callers cannot mutate the cached result
+                    return copy.deepcopy(cached[1])
+                generation = cached[2] if cached is not None else 0
+            
+            repo = GitService._pygit2_for(session_id)
+            
+            # Get modified, untracked, and staged files from a single status pass
+            modified = []
+            untracked = []
+            staged = []
+            for path, flags in repo.status().items():
+                if flags & STATUS_WORKTREE_CHANGED:
+                    modified.append(path)
+                if flags & pygit2.GIT_STATUS_WT_NEW:
+                    untracked.append(path)
+                if flags & STATUS_INDEX_CHANGED:
+                    staged.append(path)
+            
+            result = {
+                "success": True,
+                "branch": _read_head_branch(repo_path),
+                "modified": modified,
+                "untracked": untracked,
+                "staged": staged,
+                "is_dirty": bool(modified or staged),
+                "commit_count": _count_commits(repo_path)
+            }
+            
+            with _status_cache_lock:
+                # A write invalidated the session while this was computed;
+                # the result may predate it
+                cached = _status_cache.get(session_id)
+                if (cached[2] if cached is not None else 0) == generation:
+                    _status_cache[session_id] = (stamp, copy.deepcopy(result), generation)
+                    _status_cache.move_to_end(session_id)
+                    while len(_status_cache) > STATUS_CACHE_MAX_ENTRIES:
+                        _status_cache.popitem(last=False)
+            
+            return result
+        except Exception as e:
+            logger.error(f"Error getting git status: {e}")
             return {
                 "success": False,
-                "error": "Invalid session ID"
+                "error": str(e)
             }
+
+    @staticmethod
+    def get_workspace_dirty(session_id: str) -> Dict[str, any]:
+        """
+        Get only the dirty flag of a session's repository.
         
-        try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+        The on-demand counterpart to the is_dirty left as None by
+        list_workspaces: answered from the get_status cache when it is
+        still valid, otherwise from one status pass without the branch
+        lookup and commit count.
+        
+        Args:
+            session_id: Unique session identifier
             
-            repo = Repo(repo_path)
+        Returns:
+            Dict with is_dirty
+        """
+        repo_path = GitService._get_repo_path(session_id)
+        
+        if repo_path is None:
+            return _ERR_INVALID_SESSION
+        
+        try:
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            # Get modified, untracked, and staged files
-            modified = [item.a_path for item in repo.index.diff(None)]
-            untracked = repo.untracked_files
-            staged = [item.a_path for item in repo.index.diff("HEAD")]
+            is_dirty = _cached_is_dirty(repo_path)
+            if is_dirty is None:
+                repo = GitService._pygit2_for(session_id)
+                changed = STATUS_WORKTREE_CHANGED | STATUS_INDEX_CHANGED
+                is_dirty = any(flags & changed for flags in repo.status().values())
             
             return {
                 "success": True,
-                "branch": repo.active_branch.name,
-                "modified": modified,
-                "untracked": untracked,
-                "staged": staged,
-                "is_dirty": repo.is_dirty(),
-                "commit_count": len(list(repo.iter_commits()))
+                "workspace_id": session_id,
+                "is_dirty": is_dirty
             }
         except Exception as e:
-            logger.error(f"Error getting git status: {e}")
+            logger.error(f"Error getting workspace dirty flag: {e}")
             return {
                 "success": False,
                 "error": str(e)
@@ -523,26 +1389,19 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            repo = Repo(repo_path)
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
             # Stage files - validate file paths if specific files provided
             if files:
+                repo_root = _resolved_root(session_id, repo_path)
                 validated_files = []
                 for f in files:
                     if _validate_file_path(f):
-                        safe_path = _safe_resolve_path(repo_path, f)
+                        safe_path = _safe_resolve_path(repo_root, f)
                         if safe_path is not None:
                             validated_files.append(f)
                         else:
@@ -555,15 +1414,24 @@ class GitService:
                             "success": False,
                             "error": f"Invalid file path: {f}"
                         }
-                repo.index.add(validated_files)
+                # One git process stats and hashes every path in C; paths go
+                # over stdin NUL-separated and are never treated as globs
+                _git_raw(
+                    repo_path,
+                    "--literal-pathspecs", "add",
+                    "--pathspec-from-file=-", "--pathspec-file-nul",
+                    input="\x00".join(validated_files)
+                )
             else:
-                repo.git.add(A=True)  # Add all files
+                _git_raw(repo_path, "add", "-A")  # Add all files
             
-            # Create commit
+            # Create commit from the index git just wrote
+            repo = GitService._repo_for(session_id)
             commit = repo.index.commit(
                 message,
                 author=git.Actor(author_name, author_email)
             )
+            _invalidate_status_cache(session_id)
             
             return {
                 "success": True,
@@ -580,7 +1448,7 @@ class GitService:
             }
 
     @staticmethod
-    def push_changes(
+    async def push_changes(
         session_id: str,
         remote: str = "origin",
         branch: Optional[str] = None
@@ -599,26 +1467,20 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            repo = Repo(repo_path)
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
             if branch is None:
-                branch = repo.active_branch.name
+                branch = _read_head_branch(repo_path)
+                if branch is None:
+                    return _ERR_DETACHED_HEAD
             
             # Push to remote
-            origin = repo.remote(name=remote)
-            push_info = origin.push(branch)
+            async with _session_lock(session_id):
+                await _git_async(repo_path, "push", "--", remote, branch)
             
             return {
                 "success": True,
@@ -657,7 +1519,7 @@ class GitService:
             }
 
     @staticmethod
-    def pull_changes(
+    async def pull_changes(
         session_id: str,
         remote: str = "origin",
         branch: Optional[str] = None
@@ -676,26 +1538,24 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            repo = Repo(repo_path)
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
             if branch is None:
-                branch = repo.active_branch.name
+                branch = _read_head_branch(repo_path)
+                if branch is None:
+                    return _ERR_DETACHED_HEAD
             
             # Pull from remote
-            origin = repo.remote(name=remote)
-            pull_info = origin.pull(branch)
+            async with _session_lock(session_id):
+                try:
+                    await _git_async(repo_path, "pull", "--", remote, branch)
+                finally:
+                    # A conflicted pull still rewrites the worktree
+                    _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -724,22 +1584,14 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
-            
-            branches = [branch.name for branch in repo.branches]
-            current_branch = repo.active_branch.name
+            branches = _list_local_branches(repo_path)
+            current_branch = _read_head_branch(repo_path)
             
             return {
                 "success": True,
@@ -773,25 +1625,22 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
+            repo = GitService._repo_for(session_id)
             
             # Create new branch
             new_branch = repo.create_head(branch_name)
             
             if checkout:
-                new_branch.checkout()
+                try:
+                    new_branch.checkout()
+                finally:
+                    _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -821,20 +1670,17 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
-            repo.git.checkout(branch_name)
+            repo = GitService._repo_for(session_id)
+            try:
+                repo.git.checkout(branch_name)
+            finally:
+                _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -849,12 +1695,33 @@ class GitService:
             }
 
     @staticmethod
-    def get_file_tree(session_id: str) -> Dict[str, any]:
+    def get_file_tree(
+        session_id: str,
+        layout: str = "nested",
+        max_depth: int = MAX_TREE_DEPTH
+    ) -> Dict[str, any]:
         """
         Get the file tree of the repository.
         
+        Only files git would show are listed: tracked files plus untracked
+        files that are not ignored (`git ls-files -co --exclude-standard`),
+        so ignored trees such as node_modules/ are never walked.
+        
+        The "nested" layout returns a dict per node with a children list.
+        The "columns" layout returns parallel lists (names, parents, sizes)
+        where parents holds the index of each entry's directory, or -1 at
+        the repository root, plus kinds as one string with an "f" (file) or
+        "d" (directory) per entry; it is far smaller to build and encode
+        for large repositories.
+        
+        Only max_depth levels are listed. Directories at the last level
+        are marked truncated (nested) or have their index listed under
+        "truncated" (columns) instead of being expanded.
+        
         Args:
             session_id: Unique session identifier
+            layout: "nested" (default) or "columns"
+            max_depth: Number of directory levels to list (1 to MAX_TREE_DEPTH)
             
         Returns:
             Dict with file tree structure
@@ -862,50 +1729,147 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
+            return _ERR_INVALID_SESSION
+        
+        if layout not in TREE_LAYOUTS:
+            return {
+                "success": False,
+                "error": "Invalid tree layout. Use 'nested' or 'columns'"
+            }
+        
+        if not 1 <= max_depth <= MAX_TREE_DEPTH:
             return {
                 "success": False,
-                "error": "Invalid session ID"
+                "error": f"max_depth must be between 1 and {MAX_TREE_DEPTH}"
             }
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            def build_tree(path: Path, prefix: str = "") -> List[Dict]:
-                """Recursively build file tree."""
-                items = []
-                
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
+            
+            output = _git_raw(repo_path, "ls-files", "-co", "--exclude-standard", "-z")
+            
+            # Group paths into a trie of dicts (directories) and None (files);
+            # unmerged paths are listed once per stage, hence the dedupe
+            root = {}
+            truncated_dirs = set()
+            for path in dict.fromkeys(output.split("\x00")):
+                if not path:
+                    continue
+                # An untracked embedded repository is listed as "dir/"; it
+                # becomes a directory node without children
+                parts = path.rstrip("/").split("/")
+                if len(parts) > max_depth:
+                    parts = parts[:max_depth]
+                    truncated_dirs.add("/".join(parts))
+                    file_name = None
+                elif path.endswith("/"):
+                    file_name = None
+                else:
+                    file_name = parts.pop()
+                # The same name can be listed as both a file and a directory
+                # (tracked a/z deleted, untracked file a created, or the
+                # reverse); the directory form wins
+                node = root
+                for part in parts:
+                    child = node.get(part)
+                    if child is None:
+                        child = node[part] = {}
+                    node = child
+                if file_name is not None and file_name not in node:
+                    node[file_name] = None
+            
+            def file_size(rel_path: str) -> Optional[int]:
+                """Size of a listed file, or None if it is gone from disk."""
                 try:
-                    for item in sorted(path.iterdir()):
-                        # Skip .git directory
-                        if item.name == ".git":
+                    return os.lstat(os.path.join(repo_path, rel_path)).st_size
+                except (FileNotFoundError, NotADirectoryError):
+                    # Tracked but deleted (or its parent replaced by a file)
+                    return None
+            
+            if layout == "columns":
+                names = []
+                parents = []
+                kinds = []
+                sizes = []
+                truncated = []
+                
+                # Depth-first walk with an explicit stack of name-sorted
+                # directory iterators, so deep trees never recurse
+                stack = [(iter(sorted(root.items())), "", -1)]
+                while stack:
+                    entries, rel_prefix, parent = stack[-1]
+                    entry = next(entries, None)
+                    if entry is None:
+                        stack.pop()
+                        continue
+                    name, children = entry
+                    rel_path = rel_prefix + name
+                    if children is None:
+                        size = file_size(rel_path)
+                        if size is None:
                             continue
-                        
-                        rel_path = str(item.relative_to(repo_path))
-                        
-                        if item.is_file():
-                            items.append({
-                                "name": item.name,
-                                "path": rel_path,
-                                "type": "file",
-                                "size": item.stat().st_size
-                            })
-                        elif item.is_dir():
-                            items.append({
-                                "name": item.name,
-                                "path": rel_path,
-                                "type": "directory",
-                                "children": build_tree(item, prefix + "  ")
-                            })
-                except PermissionError:
-                    pass
+                        names.append(name)
+                        parents.append(parent)
+                        kinds.append("f")
+                        sizes.append(size)
+                    else:
+                        index = len(names)
+                        names.append(name)
+                        parents.append(parent)
+                        kinds.append("d")
+                        sizes.append(0)
+                        if rel_path in truncated_dirs:
+                            truncated.append(index)
+                        stack.append((iter(sorted(children.items())), rel_path + "/", index))
                 
-                return items
+                return {
+                    "success": True,
+                    "tree_soa": {
+                        "names": names,
+                        "parents": parents,
+                        "kinds": "".join(kinds),
+                        "sizes": sizes,
+                        "truncated": truncated
+                    }
+                }
             
-            tree = build_tree(repo_path)
+            # Same iterative walk; each stack frame carries the children list
+            # its entries are appended to
+            tree = []
+            stack = [(iter(sorted(root.items())), "", tree)]
+            while stack:
+                entries, rel_prefix, items = stack[-1]
+                entry = next(entries, None)
+                if entry is None:
+                    stack.pop()
+                    continue
+                name, children = entry
+                rel_path = rel_prefix + name
+                
+                if children is None:
+                    size = file_size(rel_path)
+                    if size is None:
+                        continue
+                    items.append({
+                        "name": name,
+                        "path": rel_path,
+                        "type": "file",
+                        "size": size
+                    })
+                else:
+                    child_items = []
+                    node = {
+                        "name": name,
+                        "path": rel_path,
+                        "type": "directory",
+                        "children": child_items
+                    }
+                    if rel_path in truncated_dirs:
+                        # Too deep: list the directory but not its contents
+                        node["truncated"] = True
+                    items.append(node)
+                    stack.append((iter(sorted(children.items())), rel_path + "/", child_items))
             
             return {
                 "success": True,
@@ -919,77 +1883,193 @@ class GitService:
             }
 
     @staticmethod
-    def read_file(session_id: str, file_path: str) -> Dict[str, any]:
+    def locate_file(session_id: str, file_path: str) -> Dict[str, any]:
         """
-        Read a file from the repository.
+        Resolve a regular file inside the repository without reading it.
+        
+        Used directly by the raw file endpoint, which hands the path to the
+        HTTP layer so the bytes never pass through Python.
         
         Args:
             session_id: Unique session identifier
             file_path: Relative path to file in repository
             
         Returns:
-            Dict with file content
+            Dict with the resolved full_path and its size
         """
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         # Validate file path
         if not _validate_file_path(file_path):
-            return {
-                "success": False,
-                "error": "Invalid file path"
-            }
+            return _ERR_INVALID_PATH
         
-        try:
-            # Safely resolve path
-            full_path = _safe_resolve_path(repo_path, file_path)
-            
-            if full_path is None:
-                return {
-                    "success": False,
-                    "error": "Access denied: file outside repository"
-                }
+        # Safely resolve path
+        full_path = _safe_resolve_path(_resolved_root(session_id, repo_path), file_path)
+        
+        if full_path is None:
+            return _ERR_OUT_OF_REPO
+        
+        st = _cached_stat(full_path)
+        if st is None:
+            return _ERR_NOT_FOUND
+        
+        if not stat.S_ISREG(st.st_mode):
+            return _ERR_NOT_FILE
+        
+        return {
+            "success": True,
+            "full_path": full_path,
+            "size": st.st_size,
+            "path": file_path
+        }
+
+    @staticmethod
+    async def read_file(session_id: str, file_path: str) -> ReadFileResult:
+        """
+        Read a file from the repository without blocking the event loop.
+        
+        Args:
+            session_id: Unique session identifier
+            file_path: Relative path to file in repository
             
-            if not full_path.exists():
-                return {
-                    "success": False,
-                    "error": "File not found"
-                }
+        Returns:
+            ReadFileResult with file content
+        """
+        return await anyio.to_thread.run_sync(GitService._sync_read_file, session_id, file_path)
+
+    @staticmethod
+    async def read_files(session_id: str, file_paths: List[str]) -> ReadFilesResult:
+        """
+        Read several files from the repository in one worker-thread hop.
+        
+        Args:
+            session_id: Unique session identifier
+            file_paths: Relative paths to files in repository
             
-            if not full_path.is_file():
-                return {
-                    "success": False,
-                    "error": "Path is not a file"
-                }
+        Returns:
+            ReadFilesResult mapping each path to its ReadFileResult
+        """
+        return await anyio.to_thread.run_sync(GitService._sync_read_files, session_id, file_paths)
+
+    @staticmethod
+    def _sync_read_files(session_id: str, file_paths: List[str]) -> ReadFilesResult:
+        """
+        Read several files from the repository.
+        
+        The batch shares one MAX_READ_BYTES budget; once it is used up the
+        remaining files fail instead of being read.
+        
+        Args:
+            session_id: Unique session identifier
+            file_paths: Relative paths to files in repository
             
-            # Read file content
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        Returns:
+            ReadFilesResult mapping each path to its ReadFileResult
+        """
+        if GitService._get_repo_path(session_id) is None:
+            return ReadFilesResult(success=False, error=_ERR_INVALID_SESSION["error"])
+        
+        if len(file_paths) > MAX_BATCH_READ_FILES:
+            return ReadFilesResult(
+                success=False,
+                error=f"Too many files requested (maximum {MAX_BATCH_READ_FILES})"
+            )
+        
+        files = {}
+        remaining = MAX_READ_BYTES
+        exhausted = False
+        for file_path in file_paths:
+            if exhausted:
+                files[file_path] = ReadFileResult(success=False, error=_ERR_BATCH_TOO_LARGE["error"])
+                continue
+            
+            located = GitService.locate_file(session_id, file_path)
+            size = located["size"] if located["success"] else 0
+            if remaining < size <= MAX_READ_BYTES:
+                exhausted = True
+                files[file_path] = ReadFileResult(success=False, error=_ERR_BATCH_TOO_LARGE["error"])
+                continue
+            
+            # Files over MAX_READ_BYTES on their own fail as too large
+            # without using up the budget
+            result = GitService._sync_read_file(session_id, file_path, max_bytes=remaining)
+            if result.success:
+                remaining -= size
+            files[file_path] = result
+        return ReadFilesResult(success=True, files=files)
+
+    @staticmethod
+    def _sync_read_file(
+        session_id: str, file_path: str, max_bytes: int = MAX_READ_BYTES
+    ) -> ReadFileResult:
+        """
+        Read a file from the repository.
+        
+        Args:
+            session_id: Unique session identifier
+            file_path: Relative path to file in repository
+            max_bytes: Largest file size to read
             
-            return {
-                "success": True,
-                "content": content,
-                "path": file_path
-            }
+        Returns:
+            ReadFileResult with file content
+        """
+        full_path = None
+        try:
+            located = GitService.locate_file(session_id, file_path)
+            if not located["success"]:
+                return ReadFileResult(success=False, error=located["error"])
+            full_path = located["full_path"]
+            
+            if located["size"] > max_bytes:
+                return ReadFileResult(success=False, error=_ERR_TOO_LARGE["error"])
+            
+            # Sniff a short prefix for NUL so binaries are rejected before
+            # the rest is read; read raw bytes and decode once, skipping the
+            # text-mode IO stack
+            with open(full_path, 'rb', buffering=FILE_IO_BUFFER_SIZE) as f:
+                prefix = f.read(BINARY_SNIFF_BYTES)
+                if b"\x00" in prefix:
+                    return ReadFileResult(success=False, error="File is not a text file")
+                # Bounded even if the file grew since it was stat'ed
+                rest = f.read(max_bytes + 1 - len(prefix))
+            if len(prefix) + len(rest) > max_bytes:
+                return ReadFileResult(success=False, error=_ERR_TOO_LARGE["error"])
+            content = (prefix + rest).decode('utf-8')
+            
+            return ReadFileResult(success=True, content=content, path=file_path)
+        except FileNotFoundError:
+            # Removed since its stat was cached
+            if full_path is not None:
+                _invalidate_stat(full_path)
+            return ReadFileResult(success=False, error=_ERR_NOT_FOUND["error"])
         except UnicodeDecodeError:
-            return {
-                "success": False,
-                "error": "File is not a text file"
-            }
+            return ReadFileResult(success=False, error="File is not a text file")
         except Exception as e:
             logger.error(f"Error reading file: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return ReadFileResult(success=False, error=str(e))
+
+    @staticmethod
+    async def write_file(session_id: str, file_path: str, content: str) -> Dict[str, any]:
+        """
+        Write content to a file in the repository without blocking the event loop.
+        
+        Args:
+            session_id: Unique session identifier
+            file_path: Relative path to file in repository
+            content: File content to write
+            
+        Returns:
+            Dict with write status
+        """
+        return await anyio.to_thread.run_sync(
+            GitService._sync_write_file, session_id, file_path, content
+        )
 
     @staticmethod
-    def write_file(session_id: str, file_path: str, content: str) -> Dict[str, any]:
+    def _sync_write_file(session_id: str, file_path: str, content: str) -> Dict[str, any]:
         """
         Write content to a file in the repository.
         
@@ -1004,34 +2084,33 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         # Validate file path
         if not _validate_file_path(file_path):
-            return {
-                "success": False,
-                "error": "Invalid file path"
-            }
+            return _ERR_INVALID_PATH
         
         try:
             # Safely resolve path
-            full_path = _safe_resolve_path(repo_path, file_path)
+            full_path = _safe_resolve_path(_resolved_root(session_id, repo_path), file_path)
             
             if full_path is None:
-                return {
-                    "success": False,
-                    "error": "Access denied: file outside repository"
-                }
+                return _ERR_OUT_OF_REPO
             
             # Create parent directories if needed
             full_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write file content
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode once and hand the bytes straight to os.write, skipping
+            # the file object layer; loop because writes may be partial
+            data = memoryview(content.encode('utf-8'))
+            fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            _invalidate_stat(full_path)
+            _invalidate_status_cache(session_id)
             
             return {
                 "success": True,
@@ -1065,27 +2144,22 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
-            
-            args = []
+            args = ["push"]
             if include_untracked:
                 args.append("-u")
             if message:
-                args.extend(["save", message])
+                args.extend(["-m", message])
             
-            repo.git.stash(*args)
+            try:
+                _git_raw(repo_path, "stash", *args)
+            finally:
+                _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -1112,25 +2186,18 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            repo = Repo(repo_path)
-            stash_list = repo.git.stash("list").split("\n") if repo.git.stash("list") else []
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            stashes = []
-            for stash in stash_list:
-                if stash:
-                    stashes.append(stash)
+            # Read the stash reflog in-process, formatted like `git stash list`
+            repo = GitService._pygit2_for(session_id)
+            stashes = [
+                f"stash@{{{index}}}: {stash.message}"
+                for index, stash in enumerate(repo.listall_stashes())
+            ]
             
             return {
                 "success": True,
@@ -1158,20 +2225,17 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
-            repo.git.stash("apply", f"stash@{{{stash_index}}}")
+            try:
+                _git_raw(repo_path, "stash", "apply", f"stash@{{{stash_index}}}")
+            finally:
+                # A conflicted apply still rewrites the worktree
+                _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -1199,20 +2263,17 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
-            repo.git.stash("pop", f"stash@{{{stash_index}}}")
+            try:
+                _git_raw(repo_path, "stash", "pop", f"stash@{{{stash_index}}}")
+            finally:
+                # A conflicted pop still rewrites the worktree
+                _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -1236,7 +2297,8 @@ class GitService:
         
         Args:
             session_id: Unique session identifier
-            max_count: Maximum number of commits to retrieve
+            max_count: Maximum number of commits to retrieve; negative
+                means no limit
             branch: Optional branch name (default: current branch)
             
         Returns:
@@ -1245,31 +2307,32 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            repo = Repo(repo_path)
-            
-            commits = []
-            for commit in repo.iter_commits(branch, max_count=max_count):
-                commits.append({
-                    "hash": commit.hexsha,
-                    "short_hash": commit.hexsha[:7],
-                    "author": str(commit.author),
-                    "email": commit.author.email,
-                    "message": commit.message.strip(),
-                    "date": commit.committed_datetime.isoformat(),
-                    "parent_count": len(commit.parents)
-                })
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
+            
+            repo = GitService._pygit2_for(session_id)
+            
+            # Walk history in libgit2; newest first, parents after children
+            start = repo.revparse_single(branch or "HEAD").peel(pygit2.Commit).id
+            walker = repo.walk(start, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME)
+            
+            # Preallocate the expected page; max_count is client-supplied, so
+            # only up to a bound, growing normally past it
+            # Negative counts meant "no limit" to git log --max-count
+            limit = max_count if max_count >= 0 else None
+            commits = [None] * min(max(max_count, 0), COMMIT_LOG_PREALLOC_MAX)
+            count = 0
+            for commit in islice(walker, limit):
+                entry = GitService._commit_entry(session_id, str(commit.id))
+                if count < len(commits):
+                    commits[count] = entry
+                else:
+                    commits.append(entry)
+                count += 1
+            del commits[count:]
             
             return {
                 "success": True,
@@ -1305,26 +2368,17 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         # Validate file path if provided
         if file_path and not _validate_file_path(file_path):
-            return {
-                "success": False,
-                "error": "Invalid file path"
-            }
+            return _ERR_INVALID_PATH
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
+            repo = GitService._repo_for(session_id)
             
             args = []
             if commit1:
@@ -1347,6 +2401,73 @@ class GitService:
                 "error": str(e)
             }
 
+    @staticmethod
+    def stream_diff(
+        session_id: str,
+        commit1: Optional[str] = None,
+        commit2: Optional[str] = None,
+        file_path: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Prepare a streamed diff between commits or working directory.
+        
+        Unlike get_diff, the diff text is never held in memory; the
+        returned generator reads it straight from git's stdout.
+        
+        Args:
+            session_id: Unique session identifier
+            commit1: First commit (default: HEAD)
+            commit2: Second commit (default: working directory)
+            file_path: Optional specific file path
+            
+        Returns:
+            Dict with a generator of diff chunks under "stream"
+        """
+        repo_path = GitService._get_repo_path(session_id)
+        
+        if repo_path is None:
+            return _ERR_INVALID_SESSION
+        
+        if file_path and not _validate_file_path(file_path):
+            return _ERR_INVALID_PATH
+        
+        try:
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
+            
+            # Resolve revisions up front: once streaming has started there
+            # is no way to report a bad revision back to the client.
+            repo = GitService._pygit2_for(session_id)
+            args = []
+            for rev in (commit1, commit2):
+                if not rev:
+                    continue
+                if rev.startswith("-"):
+                    return {
+                        "success": False,
+                        "error": f"Invalid revision: {rev}"
+                    }
+                repo.revparse_single(rev)
+                args.append(rev)
+            if file_path:
+                args.extend(["--", file_path])
+            
+            return {
+                "success": True,
+                "stream": _git_stream(repo_path, "diff", *args)
+            }
+        except (KeyError, ValueError, pygit2.GitError) as e:
+            return {
+                "success": False,
+                "error": f"Unknown revision: {e}"
+            }
+        except Exception as e:
+            logger.error(f"Error preparing diff stream: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
     @staticmethod
     def merge_branch(
         session_id: str,
@@ -1367,27 +2488,24 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
-            repo = Repo(repo_path)
-            current_branch = repo.active_branch.name
+            current_branch = _read_head_branch(repo_path) or "HEAD"
             
             # Perform merge
             args = [branch_name]
             if commit_message:
                 args.extend(["-m", commit_message])
             
-            repo.git.merge(*args)
+            try:
+                _git_raw(repo_path, "merge", *args)
+            finally:
+                # A conflicted merge still rewrites the worktree
+                _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -1429,17 +2547,11 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
             if mode not in ["soft", "mixed", "hard"]:
                 return {
@@ -1447,8 +2559,10 @@ class GitService:
                     "error": "Invalid reset mode. Use 'soft', 'mixed', or 'hard'"
                 }
             
-            repo = Repo(repo_path)
-            repo.git.reset(f"--{mode}", commit)
+            try:
+                _git_raw(repo_path, "reset", f"--{mode}", commit)
+            finally:
+                _invalidate_worktree_caches(session_id)
             
             return {
                 "success": True,
@@ -1485,26 +2599,18 @@ class GitService:
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return _ERR_INVALID_SESSION
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            repo = Repo(repo_path)
+            if not _repo_exists(repo_path):
+                return _ERR_NO_REPO
             
             if message:
                 # Annotated tag
-                repo.create_tag(tag_name, ref=commit, message=message)
+                _git_raw(repo_path, "tag", "-a", "-m", message, tag_name, commit)
             else:
                 # Lightweight tag
-                repo.create_tag(tag_name, ref=commit)
+                _git_raw(repo_path, "tag", tag_name, commit)
             
             return {
                 "success": True,
@@ -1520,7 +2626,7 @@ class GitService:
             }
 
     @staticmethod
-    def list_tags(session_id: str) -> Dict[str, any]:
+    def list_tags(session_id: str) -> TagListResult:
         """
         List all tags.
         
@@ -1528,34 +2634,26 @@ class GitService:
             session_id: Unique session identifier
             
         Returns:
-            Dict with tag list
+            TagListResult with tag list
         """
         repo_path = GitService._get_repo_path(session_id)
         
         if repo_path is None:
-            return {
-                "success": False,
-                "error": "Invalid session ID"
-            }
+            return TagListResult(success=False, error=_ERR_INVALID_SESSION["error"])
         
         try:
-            if not repo_path.exists():
-                return {
-                    "success": False,
-                    "error": "No repository found for this session"
-                }
-            
-            repo = Repo(repo_path)
-            tags = [tag.name for tag in repo.tags]
+            if not _repo_exists(repo_path):
+                return TagListResult(success=False, error=_ERR_NO_REPO["error"])
+            
+            # Tag refs straight from libgit2, sorted by name like `git tag --list`
+            repo = GitService._pygit2_for(session_id)
+            tags = sorted(
+                name[len("refs/tags/"):]
+                for name in repo.listall_references()
+                if name.startswith("refs/tags/")
+            )
             
-            return {
-                "success": True,
-                "tags": tags,
-                "count": len(tags)
-            }
+            return TagListResult(success=True, tags=tags, count=len(tags))
         except Exception as e:
             logger.error(f"Error listing tags: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return TagListResult(success=False, error=str(e))
@@ -1,11 +1,39 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+import json
 import logging
+import os
 import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Set PROCESS_TIME_HEADER=0 to skip the timing middleware entirely
+PROCESS_TIME_HEADER_ENABLED = os.getenv("PROCESS_TIME_HEADER", "1") != "0"
+# Probe endpoints served from pre-encoded bodies; not worth timing
+UNTIMED_PATHS = frozenset({"/", "/health"})
+
+# Constant response bodies, encoded once at import
+_ROOT_JSON = json.dumps({
+    "service": "auth-service",
+    "status": "running",
+    "version": "0.1.0"
+}).encode()
+_HEALTH_JSON = json.dumps({"status": "healthy"}).encode()
+_LOGIN_JSON = json.dumps({
+    "access_token": "placeholder_token",
+    "token_type": "bearer",
+    "user_id": 1
+}).encode()
+_REGISTER_JSON = json.dumps({
+    "message": "User registered successfully",
+    "user_id": 1
+}).encode()
+_VERIFY_JSON = json.dumps({
+    "valid": True,
+    "user_id": 1
+}).encode()
+
 app = FastAPI(
     title="Auth Service",
     description="Authentication and Authorization Service",
@@ -20,53 +48,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
+    if request.url.path in UNTIMED_PATHS:
+        return await call_next(request)
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    response.headers["X-Process-Time"] = f"{(time.perf_counter_ns() - start_ns) / 1e6:.3f}ms"
     return response
 
+if PROCESS_TIME_HEADER_ENABLED:
+    app.middleware("http")(add_process_time_header)
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting Auth Service")
 
 @app.get("/")
 async def root():
-    return {
-        "service": "auth-service",
-        "status": "running",
-        "version": "0.1.0"
-    }
+    return Response(_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy"}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 @app.post("/auth/login")
 async def login(username: str, password: str):
     """Login endpoint - placeholder"""
     logger.info(f"Login attempt: {username}")
-    return {
-        "access_token": "placeholder_token",
-        "token_type": "bearer",
-        "user_id": 1
-    }
+    return Response(_LOGIN_JSON, media_type="application/json")
 
 @app.post("/auth/register")
 async def register(username: str, email: str, password: str):
     """Register endpoint - placeholder"""
     logger.info(f"Registration: {username}")
-    return {
-        "message": "User registered successfully",
-        "user_id": 1
-    }
+    return Response(_REGISTER_JSON, media_type="application/json")
 
 @app.post("/auth/verify")
 async def verify_token(token: str):
     """Verify JWT token - placeholder"""
-    return {
-        "valid": True,
-        "user_id": 1
-    }
+    return Response(_VERIFY_JSON, media_type="application/json")
@@ -118,6 +118,22 @@ export const Dashboard: React.FC = () => {
     }
   };
 
+  // is_dirty is left null by the list; fetch it once a workspace is opened or hovered
+  const loadDirtyFlag = async (workspaceId: string) => {
+    const workspace = workspaces.find(w => w.workspace_id === workspaceId);
+    if (!workspace || workspace.is_dirty !== null) {
+      return;
+    }
+    try {
+      const status = await gitService.getWorkspaceStatus(workspaceId);
+      setWorkspaces(prev => prev.map(w =>
+        w.workspace_id === workspaceId ? { ...w, is_dirty: status.is_dirty } : w
+      ));
+    } catch (err) {
+      console.error('Failed to load workspace status:', err);
+    }
+  };
+
   const loadUserData = async () => {
     try {
       const userData = await authAPI.getCurrentUser();
@@ -592,6 +608,7 @@ export const Dashboard: React.FC = () => {
             <div
               key={workspace.workspace_id}
               className="group relative bg-black border-2 border-dashed border-orange-500/30 p-6 hover:border-orange-400 transition-all duration-300 hover:shadow-orange-500/30 cursor-pointer"
+              onMouseEnter={() => loadDirtyFlag(workspace.workspace_id)}
               onClick={() => navigate('/git')}
             >
               {/* Corner accents */}
@@ -32,6 +32,12 @@ export const GitWorkspace: React.FC = () => {
     }
   }, [user]);
 
+  useEffect(() => {
+    if (selectedWorkspace) {
+      loadDirtyFlag(selectedWorkspace);
+    }
+  }, [selectedWorkspace, workspaces.length]);
+
   const loadUser = async () => {
     try {
       const userData = await authAPI.getCurrentUser();
@@ -62,6 +68,22 @@ export const GitWorkspace: React.FC = () => {
     }
   };
 
+  // is_dirty is left null by the list; fetch it once a workspace is opened or hovered
+  const loadDirtyFlag = async (workspaceId: string) => {
+    const workspace = workspaces.find(w => w.workspace_id === workspaceId);
+    if (!workspace || workspace.is_dirty !== null) {
+      return;
+    }
+    try {
+      const status = await gitService.getWorkspaceStatus(workspaceId);
+      setWorkspaces(prev => prev.map(w =>
+        w.workspace_id === workspaceId ? { ...w, is_dirty: status.is_dirty } : w
+      ));
+    } catch (err) {
+      console.error('Failed to load workspace status:', err);
+    }
+  };
+
   if (loading) {
     return (
       <div className="min-h-screen flex items-center justify-center bg-black">
@@ -219,6 +241,7 @@ export const GitWorkspace: React.FC = () => {
                     <button
                       key={workspace.workspace_id}
                       onClick={() => setSelectedWorkspace(workspace.workspace_id)}
+                      onMouseEnter={() => loadDirtyFlag(workspace.workspace_id)}
                       className={`w-full text-left p-3 transition-all ${selectedWorkspace === workspace.workspace_id
                           ? 'bg-orange-500/20 border-2 border-orange-500'
                           : 'bg-black border-2 border-dashed border-orange-500/30 hover:border-orange-500/50 hover:bg-orange-500/10'
@@ -5,6 +5,7 @@ const API_BASE_URL = 'http://localhost:8000/api/v1';
 export interface GitCloneRequest {
   repo_url: string;
   branch?: string;
+  full_history?: boolean;
 }
 
 export interface GitCommitRequest {
@@ -35,6 +36,10 @@ export interface GitFileReadRequest {
   file_path: string;
 }
 
+export interface GitFilesReadRequest {
+  file_paths: string[];
+}
+
 export interface GitFileWriteRequest {
   file_path: string;
   content: string;
@@ -75,16 +80,35 @@ export interface GitFileContent {
   path: string;
 }
 
+export interface GitFileReadResult {
+  success: boolean;
+  content?: string;
+  path?: string;
+  error?: string;
+}
+
+export interface GitFilesContent {
+  success: boolean;
+  files: Record<string, GitFileReadResult>;
+}
+
 export interface GitWorkspace {
   workspace_id: string;
   name: string;
   path: string;
   branch: string;
   remote_url: string | null;
-  is_dirty: boolean;
+  // null until the workspace's status has been computed; see getWorkspaceStatus
+  is_dirty: boolean | null;
   commit_count: number;
 }
 
+export interface GitWorkspaceStatus {
+  success: boolean;
+  workspace_id: string;
+  is_dirty: boolean;
+}
+
 export interface GitWorkspaceList {
   success: boolean;
   workspaces: GitWorkspace[];
@@ -197,6 +221,14 @@ export class GitService {
     return response.data;
   }
 
+  async getWorkspaceStatus(workspaceId: string): Promise<GitWorkspaceStatus> {
+    const response = await axios.get(
+      `${API_BASE_URL}/git/workspaces/${workspaceId}/status`,
+      this.getAuthHeader()
+    );
+    return response.data;
+  }
+
   async cloneRepository(sessionId: string, request: GitCloneRequest) {
     const response = await axios.post(
       `${API_BASE_URL}/git/clone/${sessionId}`,
@@ -284,6 +316,27 @@ export class GitService {
     return response.data;
   }
 
+  async readFiles(sessionId: string, request: GitFilesReadRequest): Promise<GitFilesContent> {
+    const response = await axios.post(
+      `${API_BASE_URL}/git/files/read-batch/${sessionId}`,
+      request,
+      this.getAuthHeader()
+    );
+    return response.data;
+  }
+
+  async readFileRaw(sessionId: string, filePath: string): Promise<string> {
+    const response = await axios.get(
+      `${API_BASE_URL}/git/files/raw/${sessionId}`,
+      {
+        ...this.getAuthHeader(),
+        params: { file_path: filePath },
+        responseType: 'text',
+      }
+    );
+    return response.data;
+  }
+
   async writeFile(sessionId: string, request: GitFileWriteRequest) {
     const response = await axios.post(
       `${API_BASE_URL}/git/files/write/${sessionId}`,